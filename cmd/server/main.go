@@ -79,14 +79,20 @@ func setupLogger(logLevel string) *slog.Logger {
 	return logger
 }
 
-// setupEnhancedLogger creates an enhanced logger with MCP notification capability
-func setupEnhancedLogger(mcpServer *mcpserver.MCPServer, logLevel string) {
+// setupEnhancedLogger creates an enhanced logger with MCP notification capability.
+// Notifications are delivered asynchronously so logging never blocks request
+// handling; the returned handler should be closed on shutdown to drain them.
+func setupEnhancedLogger(mcpServer *mcpserver.MCPServer, logLevel string) *logging.AsyncHandler {
 	level := parseLogLevel(logLevel)
 	consoleHandler := slog.NewTextHandler(os.Stdout, &slog.HandlerOptions{Level: level})
-	mcpHandler := logging.NewMCPNotificationHandler(mcpServer, level)
+	mcpHandler := logging.NewAsyncHandler(
+		logging.NewMCPNotificationHandler(mcpServer, level),
+		logging.DefaultAsyncBufferSize,
+	)
 	multiHandler := logging.NewMultiHandler(consoleHandler, mcpHandler)
 	enhancedLogger := slog.New(multiHandler)
 	slog.SetDefault(enhancedLogger)
+	return mcpHandler
 }
 
 // createMCPServer creates and configures the MCP server
@@ -142,7 +148,8 @@ func main() {
 	mcpServer := createMCPServer(cfg)
 
 	// Now enhance the logger with MCP notification capability
-	setupEnhancedLogger(mcpServer, flags.LogLevel)
+	notificationHandler := setupEnhancedLogger(mcpServer, flags.LogLevel)
+	defer notificationHandler.Close()
 
 	// Setup signal handling for graceful shutdown
 	ctx, cancel := setupSignalHandling()
@@ -3,8 +3,11 @@ package config
 import (
 	"errors"
 	"fmt"
+	"net/http"
 	"os"
+	"strconv"
 	"strings"
+	"time"
 
 	"github.com/luno/luno-go"
 	"github.com/luno/luno-go/decimal"
@@ -18,10 +21,61 @@ const (
 	EnvLunoAPIDomain    = "LUNO_API_DOMAIN"
 	EnvLunoAPIDebug     = "LUNO_API_DEBUG"
 
+	// Cache TTL overrides, parsed as Go durations (e.g. "10s", "500ms").
+	// "0" disables caching for that endpoint.
+	EnvLunoCacheBalancesTTL  = "LUNO_CACHE_BALANCES_TTL"
+	EnvLunoCacheTickerTTL    = "LUNO_CACHE_TICKER_TTL"
+	EnvLunoCacheOrderBookTTL = "LUNO_CACHE_ORDER_BOOK_TTL"
+
+	// Cap on concurrent Luno API requests, to stay under rate limits
+	EnvLunoMaxConcurrentRequests = "LUNO_MAX_CONCURRENT_REQUESTS"
+
 	// Default Luno API domain
 	DefaultLunoDomain = "api.luno.com"
+
+	// HTTP client tuning for the Luno API. The default transport keeps only
+	// two idle connections per host, so bursts of tool calls each pay a fresh
+	// TCP+TLS handshake; a larger idle pool keeps connections alive between
+	// calls and lets them be reused.
+	httpTimeout         = 30 * time.Second
+	maxIdleConns        = 32
+	maxIdleConnsPerHost = 16
+	idleConnTimeout     = 90 * time.Second
 )
 
+// newHTTPClient creates the pooled HTTP client used for all Luno API calls.
+// The concurrency cap sits closest to the network so every retry attempt
+// counts against it; latency tracking wraps the whole chain.
+func newHTTPClient() *http.Client {
+	pooled := &http.Transport{
+		Proxy:               http.ProxyFromEnvironment,
+		ForceAttemptHTTP2:   true,
+		MaxIdleConns:        maxIdleConns,
+		MaxIdleConnsPerHost: maxIdleConnsPerHost,
+		IdleConnTimeout:     idleConnTimeout,
+	}
+	limited := sdk.NewLimitTransport(pooled, maxConcurrentRequests())
+	return &http.Client{
+		Timeout:   httpTimeout,
+		Transport: sdk.NewLatencyTransport(sdk.NewRetryTransport(limited)),
+	}
+}
+
+// maxConcurrentRequests returns the concurrent request cap, applying any
+// environment override
+func maxConcurrentRequests() int {
+	value := os.Getenv(strings.TrimSpace(EnvLunoMaxConcurrentRequests))
+	if value == "" {
+		return sdk.DefaultMaxConcurrentRequests
+	}
+	limit, err := strconv.Atoi(value)
+	if err != nil || limit <= 0 {
+		fmt.Printf("Ignoring invalid %s value %q\n", EnvLunoMaxConcurrentRequests, value)
+		return sdk.DefaultMaxConcurrentRequests
+	}
+	return limit
+}
+
 // Config holds the configuration for the application
 type Config struct {
 	// Luno client
@@ -36,6 +90,30 @@ func maskValue(s string) string {
 	return s[:4] + strings.Repeat("*", len(s)-4)
 }
 
+// ttlFromEnv returns the duration from the given environment variable, or the
+// fallback when the variable is unset or unparseable
+func ttlFromEnv(key string, fallback time.Duration) time.Duration {
+	value := os.Getenv(strings.TrimSpace(key))
+	if value == "" {
+		return fallback
+	}
+	ttl, err := time.ParseDuration(value)
+	if err != nil {
+		fmt.Printf("Ignoring invalid %s value %q: %v\n", key, value, err)
+		return fallback
+	}
+	return ttl
+}
+
+// cacheTTLs returns the cache configuration, applying any environment overrides
+func cacheTTLs() sdk.CacheTTLs {
+	ttls := sdk.DefaultCacheTTLs()
+	ttls.Balances = ttlFromEnv(EnvLunoCacheBalancesTTL, ttls.Balances)
+	ttls.Ticker = ttlFromEnv(EnvLunoCacheTickerTTL, ttls.Ticker)
+	ttls.OrderBook = ttlFromEnv(EnvLunoCacheOrderBookTTL, ttls.OrderBook)
+	return ttls
+}
+
 // Load loads the configuration from environment variables
 func Load(domainOverride string) (*Config, error) {
 	apiKeyID := os.Getenv(strings.TrimSpace(EnvLunoAPIKeyID))
@@ -65,6 +143,7 @@ func Load(domainOverride string) (*Config, error) {
 
 	// Create Luno client
 	client := luno.NewClient()
+	client.SetHTTPClient(newHTTPClient())
 	if domain != DefaultLunoDomain {
 		client.SetBaseURL(fmt.Sprintf("https://%s", domain))
 	}
@@ -88,7 +167,7 @@ func Load(domainOverride string) (*Config, error) {
 
 	client.SetDebug(debugMode)
 	return &Config{
-		LunoClient: client,
+		LunoClient: sdk.NewCachingClientWithTTLs(client, cacheTTLs()),
 	}, nil
 }
 
@@ -4,8 +4,10 @@ import (
 	"os"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/luno/luno-go/decimal"
+	"github.com/luno/luno-mcp/sdk"
 )
 
 func TestMaskValue(t *testing.T) {
@@ -63,6 +65,86 @@ func TestFormatCurrency(t *testing.T) {
 	}
 }
 
+func TestTTLFromEnv(t *testing.T) {
+	const fallback = 30 * time.Second
+
+	tests := []struct {
+		name     string
+		value    string
+		expected time.Duration
+	}{
+		{"unset uses fallback", "", fallback},
+		{"valid duration", "10s", 10 * time.Second},
+		{"millisecond duration", "500ms", 500 * time.Millisecond},
+		{"zero disables caching", "0", 0},
+		{"invalid value uses fallback", "not_a_duration", fallback},
+	}
+
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			if tc.value != "" {
+				t.Setenv(EnvLunoCacheBalancesTTL, tc.value)
+			}
+
+			result := ttlFromEnv(EnvLunoCacheBalancesTTL, fallback)
+			if result != tc.expected {
+				t.Errorf("ttlFromEnv(%q) = %v, want %v", tc.value, result, tc.expected)
+			}
+		})
+	}
+}
+
+func TestCacheTTLs(t *testing.T) {
+	t.Run("defaults when unset", func(t *testing.T) {
+		ttls := cacheTTLs()
+		if ttls != sdk.DefaultCacheTTLs() {
+			t.Errorf("cacheTTLs() = %+v, want defaults %+v", ttls, sdk.DefaultCacheTTLs())
+		}
+	})
+
+	t.Run("environment overrides", func(t *testing.T) {
+		t.Setenv(EnvLunoCacheBalancesTTL, "1m")
+		t.Setenv(EnvLunoCacheTickerTTL, "0")
+
+		ttls := cacheTTLs()
+		if ttls.Balances != time.Minute {
+			t.Errorf("Balances TTL = %v, want %v", ttls.Balances, time.Minute)
+		}
+		if ttls.Ticker != 0 {
+			t.Errorf("Ticker TTL = %v, want 0", ttls.Ticker)
+		}
+		if ttls.OrderBook != sdk.DefaultCacheTTLs().OrderBook {
+			t.Errorf("OrderBook TTL = %v, want default %v", ttls.OrderBook, sdk.DefaultCacheTTLs().OrderBook)
+		}
+	})
+}
+
+func TestMaxConcurrentRequests(t *testing.T) {
+	tests := []struct {
+		name     string
+		value    string
+		expected int
+	}{
+		{"unset uses default", "", sdk.DefaultMaxConcurrentRequests},
+		{"valid override", "4", 4},
+		{"invalid value uses default", "not_a_number", sdk.DefaultMaxConcurrentRequests},
+		{"non-positive value uses default", "0", sdk.DefaultMaxConcurrentRequests},
+	}
+
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			if tc.value != "" {
+				t.Setenv(EnvLunoMaxConcurrentRequests, tc.value)
+			}
+
+			result := maxConcurrentRequests()
+			if result != tc.expected {
+				t.Errorf("maxConcurrentRequests() = %d, want %d", result, tc.expected)
+			}
+		})
+	}
+}
+
 func TestLoad(t *testing.T) {
 	originalAPIKeyID := os.Getenv(EnvLunoAPIKeyID)
 	originalAPISecret := os.Getenv(EnvLunoAPIKeySecret)
@@ -0,0 +1,24 @@
+// Package jsonutil provides the JSON encoding helper shared by tool and
+// resource handlers.
+package jsonutil
+
+import (
+	"bytes"
+	"encoding/json"
+)
+
+// MarshalIndent encodes v as indented JSON for returning to MCP clients.
+// Unlike json.MarshalIndent it encodes in a single pass instead of
+// marshalling and then re-indenting, and it skips HTML escaping, which is
+// cheaper and keeps characters like & and < readable in tool output.
+func MarshalIndent(v any) ([]byte, error) {
+	var buf bytes.Buffer
+	enc := json.NewEncoder(&buf)
+	enc.SetEscapeHTML(false)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(v); err != nil {
+		return nil, err
+	}
+	// Encode appends a trailing newline that MarshalIndent would not produce
+	return bytes.TrimRight(buf.Bytes(), "\n"), nil
+}
@@ -0,0 +1,33 @@
+package jsonutil
+
+import (
+	"encoding/json"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestMarshalIndent(t *testing.T) {
+	value := map[string]any{
+		"pair":  "XBTZAR",
+		"price": "800000",
+	}
+
+	result, err := MarshalIndent(value)
+	assert.NoError(t, err)
+
+	expected, err := json.MarshalIndent(value, "", "  ")
+	assert.NoError(t, err)
+	assert.Equal(t, string(expected), string(result))
+}
+
+func TestMarshalIndentDoesNotEscapeHTML(t *testing.T) {
+	result, err := MarshalIndent(map[string]string{"description": "fees < 1% & falling"})
+	assert.NoError(t, err)
+	assert.Contains(t, string(result), "fees < 1% & falling")
+}
+
+func TestMarshalIndentError(t *testing.T) {
+	_, err := MarshalIndent(func() {})
+	assert.Error(t, err)
+}
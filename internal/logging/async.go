@@ -0,0 +1,117 @@
+package logging
+
+import (
+	"context"
+	"log/slog"
+	"sync"
+)
+
+// DefaultAsyncBufferSize is the queue capacity used for the async handler
+const DefaultAsyncBufferSize = 256
+
+// asyncRecord is a queued log record together with the handler that should
+// deliver it, so handlers derived via WithAttrs/WithGroup share one queue.
+type asyncRecord struct {
+	ctx     context.Context
+	record  slog.Record
+	handler slog.Handler
+}
+
+// asyncQueue is the delivery machinery shared by an AsyncHandler and all
+// handlers derived from it. The mutex and closed flag make enqueueing safe
+// against a concurrent close: a send on a closed channel would panic even
+// inside a select, and the handler may be installed as the process-wide slog
+// default, where late records during shutdown are unavoidable.
+type asyncQueue struct {
+	records chan asyncRecord
+	done    chan struct{}
+
+	mu     sync.Mutex
+	closed bool
+}
+
+// AsyncHandler decorates another slog.Handler so records are delivered by a
+// background goroutine instead of on the caller's critical path. This keeps
+// potentially slow deliveries (such as MCP client notifications) from adding
+// latency to every request that logs. When the queue is full, records are
+// dropped rather than blocking the caller.
+type AsyncHandler struct {
+	inner slog.Handler
+	queue *asyncQueue
+}
+
+// NewAsyncHandler creates an AsyncHandler around inner and starts its
+// delivery goroutine. Call Close during shutdown to drain the queue.
+func NewAsyncHandler(inner slog.Handler, bufferSize int) *AsyncHandler {
+	queue := &asyncQueue{
+		records: make(chan asyncRecord, bufferSize),
+		done:    make(chan struct{}),
+	}
+	go queue.run()
+	return &AsyncHandler{inner: inner, queue: queue}
+}
+
+// run delivers queued records until the queue is closed
+func (q *asyncQueue) run() {
+	defer close(q.done)
+	for rec := range q.records {
+		// Delivery errors can no longer be reported to the original caller.
+		_ = rec.handler.Handle(rec.ctx, rec.record)
+	}
+}
+
+// enqueue adds a record for background delivery without blocking. Records
+// are dropped when the queue is full or already closed.
+func (q *asyncQueue) enqueue(rec asyncRecord) {
+	q.mu.Lock()
+	defer q.mu.Unlock()
+	if q.closed {
+		return
+	}
+	select {
+	case q.records <- rec:
+	default:
+		// Queue is full; dropping a log record is preferable to blocking the caller.
+	}
+}
+
+// close stops accepting records and blocks until queued records are delivered
+func (q *asyncQueue) close() {
+	q.mu.Lock()
+	if !q.closed {
+		q.closed = true
+		close(q.records)
+	}
+	q.mu.Unlock()
+	<-q.done
+}
+
+// Enabled implements slog.Handler
+func (h *AsyncHandler) Enabled(ctx context.Context, level slog.Level) bool {
+	return h.inner.Enabled(ctx, level)
+}
+
+// Handle implements slog.Handler by enqueueing the record for background
+// delivery. It never blocks: records are dropped if the queue is full or
+// the handler has been closed.
+func (h *AsyncHandler) Handle(ctx context.Context, record slog.Record) error {
+	h.queue.enqueue(asyncRecord{ctx: ctx, record: record.Clone(), handler: h.inner})
+	return nil
+}
+
+// WithAttrs implements slog.Handler
+func (h *AsyncHandler) WithAttrs(attrs []slog.Attr) slog.Handler {
+	return &AsyncHandler{inner: h.inner.WithAttrs(attrs), queue: h.queue}
+}
+
+// WithGroup implements slog.Handler
+func (h *AsyncHandler) WithGroup(name string) slog.Handler {
+	return &AsyncHandler{inner: h.inner.WithGroup(name), queue: h.queue}
+}
+
+// Close stops accepting new records and blocks until all queued records have
+// been delivered. It is safe to call more than once and safe against
+// concurrent Handle calls, which drop their records once closing has begun.
+func (h *AsyncHandler) Close() {
+	h.queue.close()
+}
@@ -0,0 +1,92 @@
+package logging
+
+import (
+	"bytes"
+	"context"
+	"log/slog"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestAsyncHandlerDeliversRecords(t *testing.T) {
+	var buf bytes.Buffer
+	inner := slog.NewJSONHandler(&buf, &slog.HandlerOptions{Level: slog.LevelDebug})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+
+	record := slog.NewRecord(time.Now(), slog.LevelInfo, testMessageDefault, 0)
+	err := handler.Handle(context.Background(), record)
+	assert.NoError(t, err, "Handle should never return an error")
+
+	// Close drains the queue, so the record must have been delivered after it returns.
+	handler.Close()
+	assert.True(t, strings.Contains(buf.String(), testMessageDefault), "record should reach the inner handler")
+}
+
+func TestAsyncHandlerEnabledDelegates(t *testing.T) {
+	inner := slog.NewJSONHandler(&bytes.Buffer{}, &slog.HandlerOptions{Level: slog.LevelInfo})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+	defer handler.Close()
+
+	assert.True(t, handler.Enabled(context.Background(), slog.LevelInfo))
+	assert.False(t, handler.Enabled(context.Background(), slog.LevelDebug))
+}
+
+func TestAsyncHandlerWithAttrsSharesQueue(t *testing.T) {
+	var buf bytes.Buffer
+	inner := slog.NewJSONHandler(&buf, &slog.HandlerOptions{Level: slog.LevelDebug})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+
+	derived := handler.WithAttrs([]slog.Attr{slog.String("component", "test")})
+	record := slog.NewRecord(time.Now(), slog.LevelInfo, testMessageDefault, 0)
+	err := derived.Handle(context.Background(), record)
+	assert.NoError(t, err)
+
+	// Closing the root handler drains records enqueued via derived handlers too.
+	handler.Close()
+	assert.True(t, strings.Contains(buf.String(), testMessageDefault))
+	assert.True(t, strings.Contains(buf.String(), jsonTestComponentAttr), "derived attrs should be applied")
+}
+
+func TestAsyncHandlerCloseIsIdempotent(t *testing.T) {
+	inner := slog.NewJSONHandler(&bytes.Buffer{}, &slog.HandlerOptions{Level: slog.LevelDebug})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+
+	handler.Close()
+	assert.NotPanics(t, func() { handler.Close() })
+}
+
+func TestAsyncHandlerHandleAfterCloseDropsRecord(t *testing.T) {
+	var buf bytes.Buffer
+	inner := slog.NewJSONHandler(&buf, &slog.HandlerOptions{Level: slog.LevelDebug})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+	handler.Close()
+
+	record := slog.NewRecord(time.Now(), slog.LevelInfo, testMessageDefault, 0)
+	assert.NotPanics(t, func() {
+		err := handler.Handle(context.Background(), record)
+		assert.NoError(t, err)
+	})
+	assert.Empty(t, buf.String(), "records after Close should be dropped")
+}
+
+func TestAsyncHandlerHandleRacesClose(t *testing.T) {
+	inner := slog.NewJSONHandler(&bytes.Buffer{}, &slog.HandlerOptions{Level: slog.LevelDebug})
+	handler := NewAsyncHandler(inner, DefaultAsyncBufferSize)
+
+	// Hammer Handle from another goroutine while Close runs, as shutdown
+	// logging from server and signal goroutines does in main.
+	stop := make(chan struct{})
+	go func() {
+		defer close(stop)
+		record := slog.NewRecord(time.Now(), slog.LevelInfo, testMessageDefault, 0)
+		for range 1000 {
+			_ = handler.Handle(context.Background(), record)
+		}
+	}()
+
+	assert.NotPanics(t, func() { handler.Close() })
+	<-stop
+}
@@ -2,13 +2,14 @@ package resources
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"strconv"
 	"strings"
 
 	"github.com/luno/luno-go"
 	"github.com/luno/luno-mcp/internal/config"
+	"github.com/luno/luno-mcp/internal/jsonutil"
+	"github.com/luno/luno-mcp/internal/tools"
 	"github.com/mark3labs/mcp-go/mcp"
 	"github.com/mark3labs/mcp-go/server"
 )
@@ -45,7 +46,9 @@ func HandleWalletResource(cfg *config.Config) server.ResourceHandlerFunc {
 			return nil, fmt.Errorf("failed to get balances: %w", err)
 		}
 
-		balancesJSON, err := json.MarshalIndent(balances, "", "  ")
+		// Share the get_balances tool's enhanced form so both surfaces parse
+		// and sort the balances the same way, exactly once
+		balancesJSON, err := jsonutil.MarshalIndent(tools.EnhanceBalances(balances.Balance))
 		if err != nil {
 			return nil, fmt.Errorf("failed to marshal balances: %w", err)
 		}
@@ -126,7 +129,7 @@ func HandleTransactionsResource(cfg *config.Config) server.ResourceHandlerFunc {
 			return nil, fmt.Errorf("failed to get transactions: %w", err)
 		}
 
-		transactionsJSON, err := json.MarshalIndent(transactions, "", "  ")
+		transactionsJSON, err := jsonutil.MarshalIndent(transactions)
 		if err != nil {
 			return nil, fmt.Errorf("failed to marshal transactions: %w", err)
 		}
@@ -210,7 +213,7 @@ func HandleAccountTemplate(cfg *config.Config) server.ResourceTemplateHandlerFun
 			"transactions": transactions.Transactions,
 		}
 
-		resultJSON, err := json.MarshalIndent(result, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(result)
 		if err != nil {
 			return nil, fmt.Errorf("failed to marshal account details: %w", err)
 		}
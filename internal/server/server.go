@@ -66,6 +66,9 @@ func registerTools(server *mcpserver.MCPServer, cfg *config.Config) {
 	tickerTool := tools.NewGetTickerTool()
 	server.AddTool(tickerTool, tools.HandleGetTicker(cfg))
 
+	tickersTool := tools.NewGetTickersTool()
+	server.AddTool(tickersTool, tools.HandleGetTickers(cfg))
+
 	orderBookTool := tools.NewGetOrderBookTool()
 	server.AddTool(orderBookTool, tools.HandleGetOrderBook(cfg))
 
@@ -76,6 +79,9 @@ func registerTools(server *mcpserver.MCPServer, cfg *config.Config) {
 	cancelOrderTool := tools.NewCancelOrderTool()
 	server.AddTool(cancelOrderTool, tools.HandleCancelOrder(cfg))
 
+	cancelAllOrdersTool := tools.NewCancelAllOrdersTool()
+	server.AddTool(cancelAllOrdersTool, tools.HandleCancelAllOrders(cfg))
+
 	listOrdersTool := tools.NewListOrdersTool()
 	server.AddTool(listOrdersTool, tools.HandleListOrders(cfg))
 
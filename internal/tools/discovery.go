@@ -11,44 +11,69 @@ import (
 
 // GetMarketInfo returns a detailed description of the market situation
 func GetMarketInfo(ctx context.Context, cfg *config.Config, pair string) (string, error) {
-	// First check if the pair is valid by trying to get ticker info
-	ticker, err := cfg.LunoClient.GetTicker(ctx, &luno.GetTickerRequest{Pair: pair})
-	if err != nil {
-		return "", fmt.Errorf("could not get market info for %s: %w", pair, err)
-	}
+	// The ticker and order book calls are independent, so fetch them
+	// concurrently rather than paying two sequential API round-trips.
+	var (
+		ticker    *luno.GetTickerResponse
+		orderBook *luno.GetOrderBookResponse
+		tickerErr error
+		bookErr   error
+	)
+
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		orderBook, bookErr = cfg.LunoClient.GetOrderBook(ctx, &luno.GetOrderBookRequest{Pair: pair})
+	}()
+	ticker, tickerErr = cfg.LunoClient.GetTicker(ctx, &luno.GetTickerRequest{Pair: pair})
+	<-done
 
-	orderBook, err := cfg.LunoClient.GetOrderBook(ctx, &luno.GetOrderBookRequest{Pair: pair})
-	if err != nil {
-		return "", fmt.Errorf("got ticker but could not get order book for %s: %w", pair, err)
+	// Report the ticker failure first so a bad pair surfaces as such.
+	if tickerErr != nil {
+		return "", fmt.Errorf("could not get market info for %s: %w", pair, tickerErr)
+	}
+	if bookErr != nil {
+		return "", fmt.Errorf("got ticker but could not get order book for %s: %w", pair, bookErr)
 	}
 
+	// Plain WriteString concatenation writes straight into the builder
+	// without a fmt format-string parse and Sprintf allocation per line.
 	var marketInfo strings.Builder
 
-	marketInfo.WriteString(fmt.Sprintf("Market info for %s:\n", pair))
-	marketInfo.WriteString(fmt.Sprintf("Last trade price: %s\n", ticker.LastTrade.String()))
-	marketInfo.WriteString(fmt.Sprintf("Ask (Sell) price: %s\n", ticker.Ask.String()))
-	marketInfo.WriteString(fmt.Sprintf("Bid (Buy) price: %s\n", ticker.Bid.String()))
-	marketInfo.WriteString(fmt.Sprintf("24-hour volume: %s\n\n", ticker.Rolling24HourVolume.String()))
+	marketInfo.WriteString("Market info for ")
+	marketInfo.WriteString(pair)
+	marketInfo.WriteString(":\nLast trade price: ")
+	marketInfo.WriteString(ticker.LastTrade.String())
+	marketInfo.WriteString("\nAsk (Sell) price: ")
+	marketInfo.WriteString(ticker.Ask.String())
+	marketInfo.WriteString("\nBid (Buy) price: ")
+	marketInfo.WriteString(ticker.Bid.String())
+	marketInfo.WriteString("\n24-hour volume: ")
+	marketInfo.WriteString(ticker.Rolling24HourVolume.String())
+	marketInfo.WriteString("\n\n")
 
 	// Add some order book info
 	marketInfo.WriteString("Current Order Book:\n")
 	if len(orderBook.Asks) > 0 {
 		marketInfo.WriteString("Top 3 asks (Sell orders): \n")
-		for i := 0; i < 3 && i < len(orderBook.Asks); i++ {
-			marketInfo.WriteString(fmt.Sprintf("  %s @ %s\n",
-				orderBook.Asks[i].Volume.String(),
-				orderBook.Asks[i].Price.String()))
-		}
+		writeTopOrders(&marketInfo, orderBook.Asks)
 	}
 
 	if len(orderBook.Bids) > 0 {
 		marketInfo.WriteString("Top 3 bids (Buy orders): \n")
-		for i := 0; i < 3 && i < len(orderBook.Bids); i++ {
-			marketInfo.WriteString(fmt.Sprintf("  %s @ %s\n",
-				orderBook.Bids[i].Volume.String(),
-				orderBook.Bids[i].Price.String()))
-		}
+		writeTopOrders(&marketInfo, orderBook.Bids)
 	}
 
 	return marketInfo.String(), nil
 }
+
+// writeTopOrders appends up to the top three order book entries to the builder
+func writeTopOrders(b *strings.Builder, entries []luno.OrderBookEntry) {
+	for i := 0; i < 3 && i < len(entries); i++ {
+		b.WriteString("  ")
+		b.WriteString(entries[i].Volume.String())
+		b.WriteString(" @ ")
+		b.WriteString(entries[i].Price.String())
+		b.WriteString("\n")
+	}
+}
@@ -2,16 +2,18 @@ package tools
 
 import (
 	"context"
-	"encoding/json"
 	"fmt"
 	"log/slog"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/luno/luno-go"
 	"github.com/luno/luno-go/decimal"
 	"github.com/luno/luno-mcp/internal/config"
+	"github.com/luno/luno-mcp/internal/jsonutil"
 	"github.com/mark3labs/mcp-go/mcp"
 	"github.com/mark3labs/mcp-go/server"
 )
@@ -27,9 +29,11 @@ const (
 const (
 	GetBalancesToolID      = "get_balances"
 	GetTickerToolID        = "get_ticker"
+	GetTickersToolID       = "get_tickers"
 	GetOrderBookToolID     = "get_order_book"
 	CreateOrderToolID      = "create_order"
 	CancelOrderToolID      = "cancel_order"
+	CancelAllOrdersToolID  = "cancel_all_orders"
 	ListOrdersToolID       = "list_orders"
 	ListTransactionsToolID = "list_transactions"
 	GetTransactionToolID   = "get_transaction"
@@ -46,6 +50,41 @@ func NewGetBalancesTool() mcp.Tool {
 	)
 }
 
+// EnhancedBalance is the readable balance representation returned by the
+// get_balances tool and the wallet resource
+type EnhancedBalance struct {
+	AccountID   string `json:"account_id"`
+	Asset       string `json:"asset"`
+	Balance     string `json:"balance"`
+	Reserved    string `json:"reserved"`
+	Unconfirmed string `json:"unconfirmed"`
+	Name        string `json:"name"`
+}
+
+// EnhanceBalances converts raw account balances into their enhanced form,
+// formatting each decimal once and sorting once (by asset, then account ID)
+// so every consumer gets deterministic output without re-processing
+func EnhanceBalances(balances []luno.AccountBalance) []EnhancedBalance {
+	enhanced := make([]EnhancedBalance, 0, len(balances))
+	for _, balance := range balances {
+		enhanced = append(enhanced, EnhancedBalance{
+			AccountID:   balance.AccountId,
+			Asset:       balance.Asset,
+			Balance:     balance.Balance.String(),
+			Reserved:    balance.Reserved.String(),
+			Unconfirmed: balance.Unconfirmed.String(),
+			Name:        balance.Name,
+		})
+	}
+	sort.Slice(enhanced, func(i, j int) bool {
+		if enhanced[i].Asset != enhanced[j].Asset {
+			return enhanced[i].Asset < enhanced[j].Asset
+		}
+		return enhanced[i].AccountID < enhanced[j].AccountID
+	})
+	return enhanced
+}
+
 // HandleGetBalances handles the get_balances tool
 func HandleGetBalances(cfg *config.Config) server.ToolHandlerFunc {
 	return func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
@@ -56,29 +95,7 @@ func HandleGetBalances(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to get balances: %v", err)), nil
 		}
 
-		// Enhance the response with additional information
-		type EnhancedBalance struct {
-			AccountID   string `json:"account_id"`
-			Asset       string `json:"asset"`
-			Balance     string `json:"balance"`
-			Reserved    string `json:"reserved"`
-			Unconfirmed string `json:"unconfirmed"`
-			Name        string `json:"name"`
-		}
-
-		enhancedBalances := make([]EnhancedBalance, 0, len(balances.Balance))
-		for _, balance := range balances.Balance {
-			enhancedBalances = append(enhancedBalances, EnhancedBalance{
-				AccountID:   balance.AccountId,
-				Asset:       balance.Asset,
-				Balance:     balance.Balance.String(),
-				Reserved:    balance.Reserved.String(),
-				Unconfirmed: balance.Unconfirmed.String(),
-				Name:        balance.Name,
-			})
-		}
-
-		resultJSON, err := json.MarshalIndent(enhancedBalances, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(EnhanceBalances(balances.Balance))
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal balances: %v", err)), nil
 		}
@@ -120,7 +137,7 @@ func HandleGetTicker(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultErrorFromErr("getting ticker", err), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(ticker, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(ticker)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal ticker: %v", err)), nil
 		}
@@ -129,6 +146,50 @@ func HandleGetTicker(cfg *config.Config) server.ToolHandlerFunc {
 	}
 }
 
+// NewGetTickersTool creates a new tool for getting tickers for multiple pairs
+func NewGetTickersTool() mcp.Tool {
+	return mcp.NewTool(
+		GetTickersToolID,
+		mcp.WithDescription("Get ticker information for multiple trading pairs in a single call"),
+		mcp.WithString(
+			"pairs",
+			mcp.Description("Comma-separated trading pairs (e.g., XBTZAR,ETHZAR). Omit to get tickers for all pairs."),
+		),
+	)
+}
+
+// HandleGetTickers handles the get_tickers tool
+func HandleGetTickers(cfg *config.Config) server.ToolHandlerFunc {
+	return func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
+		// One tickers call replaces a per-pair get_ticker fan-out, so a
+		// client watching several markets pays a single API round-trip.
+		var pairs []string
+		if pairsStr := request.GetString("pairs", ""); pairsStr != "" {
+			for _, pair := range strings.Split(pairsStr, ",") {
+				pair = strings.TrimSpace(pair)
+				if pair == "" {
+					continue
+				}
+				pairs = append(pairs, normalizeCurrencyPair(pair))
+			}
+		}
+
+		tickers, err := cfg.LunoClient.GetTickers(ctx, &luno.GetTickersRequest{
+			Pair: pairs,
+		})
+		if err != nil {
+			return mcp.NewToolResultErrorFromErr("getting tickers", err), nil
+		}
+
+		resultJSON, err := jsonutil.MarshalIndent(tickers)
+		if err != nil {
+			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal tickers: %v", err)), nil
+		}
+
+		return mcp.NewToolResultText(string(resultJSON)), nil
+	}
+}
+
 // NewGetOrderBookTool creates a new tool for getting the order book
 func NewGetOrderBookTool() mcp.Tool {
 	return mcp.NewTool(
@@ -160,7 +221,7 @@ func HandleGetOrderBook(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultErrorFromErr("getting order book", err), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(orderBook, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(orderBook)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal order book: %v", err)), nil
 		}
@@ -287,7 +348,7 @@ func HandleCreateOrder(cfg *config.Config) server.ToolHandlerFunc {
 		}
 
 		// Order succeeded
-		resultJSON, err := json.MarshalIndent(order, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(order)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal order result: %v", err)), nil
 		}
@@ -302,11 +363,11 @@ func HandleCreateOrder(cfg *config.Config) server.ToolHandlerFunc {
 func NewCancelOrderTool() mcp.Tool {
 	return mcp.NewTool(
 		CancelOrderToolID,
-		mcp.WithDescription("Cancel an order"),
+		mcp.WithDescription("Cancel one or more orders"),
 		mcp.WithString(
 			"order_id",
 			mcp.Required(),
-			mcp.Description("Order ID to cancel"),
+			mcp.Description("Order ID to cancel, or a comma-separated list of order IDs to cancel as a batch"),
 		),
 	)
 }
@@ -321,14 +382,38 @@ func HandleCancelOrder(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultErrorFromErr("getting order_id from request", err), nil
 		}
 
+		// The parsed list is authoritative: a single ID goes through the
+		// plain cancellation path, while multiple comma-separated IDs are
+		// cancelled as a concurrent batch so the caller pays roughly one
+		// round-trip instead of one per order.
+		orderIDs := splitOrderIDs(orderID)
+		if len(orderIDs) == 0 {
+			return mcp.NewToolResultError("order_id must contain at least one order ID"), nil
+		}
+
+		if len(orderIDs) > 1 {
+			targets := make([]cancelTarget, len(orderIDs))
+			for i, id := range orderIDs {
+				targets[i] = cancelTarget{OrderID: id}
+			}
+			results := cancelOrdersConcurrently(ctx, cfg, targets)
+
+			resultJSON, err := jsonutil.MarshalIndent(results)
+			if err != nil {
+				return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal results: %v", err)), nil
+			}
+			return mcp.NewToolResultText(fmt.Sprintf("Cancelled %d of %d orders:\n\n%s",
+				countCancelled(results), len(results), string(resultJSON))), nil
+		}
+
 		result, err := cfg.LunoClient.StopOrder(ctx, &luno.StopOrderRequest{
-			OrderId: orderID,
+			OrderId: orderIDs[0],
 		})
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to cancel order: %v", err)), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(result, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(result)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal result: %v", err)), nil
 		}
@@ -337,6 +422,154 @@ func HandleCancelOrder(cfg *config.Config) server.ToolHandlerFunc {
 	}
 }
 
+// splitOrderIDs splits a comma-separated order_id value, dropping empty entries
+func splitOrderIDs(orderID string) []string {
+	var orderIDs []string
+	for _, id := range strings.Split(orderID, ",") {
+		if id = strings.TrimSpace(id); id != "" {
+			orderIDs = append(orderIDs, id)
+		}
+	}
+	return orderIDs
+}
+
+// maxConcurrentCancels bounds the cancellation fan-out so a large set of open
+// orders cannot flood the API with simultaneous calls.
+const maxConcurrentCancels = 8
+
+// cancelTarget identifies a single order to cancel
+type cancelTarget struct {
+	OrderID string
+	Pair    string
+}
+
+// cancelResult reports the outcome of one cancellation within a batch
+type cancelResult struct {
+	OrderID string `json:"order_id"`
+	Pair    string `json:"pair,omitempty"`
+	Success bool   `json:"success"`
+	Error   string `json:"error,omitempty"`
+}
+
+// cancelOrdersConcurrently cancels the given orders with a bounded concurrent
+// fan-out and returns one result per order, in input order
+func cancelOrdersConcurrently(ctx context.Context, cfg *config.Config, targets []cancelTarget) []cancelResult {
+	results := make([]cancelResult, len(targets))
+	sem := make(chan struct{}, maxConcurrentCancels)
+	var wg sync.WaitGroup
+	for i, target := range targets {
+		wg.Add(1)
+		go func(i int, target cancelTarget) {
+			defer wg.Done()
+			sem <- struct{}{}
+			defer func() { <-sem }()
+
+			result := cancelResult{OrderID: target.OrderID, Pair: target.Pair}
+			res, err := cfg.LunoClient.StopOrder(ctx, &luno.StopOrderRequest{OrderId: target.OrderID})
+			if err != nil {
+				result.Error = err.Error()
+			} else {
+				result.Success = res.Success
+			}
+			results[i] = result
+		}(i, target)
+	}
+	wg.Wait()
+	return results
+}
+
+// countCancelled returns how many results in the batch succeeded
+func countCancelled(results []cancelResult) int {
+	cancelled := 0
+	for _, result := range results {
+		if result.Success {
+			cancelled++
+		}
+	}
+	return cancelled
+}
+
+// cancelAllPageSize is how many pending orders each listing pass requests.
+// A full page means more orders may remain, so the handler lists again.
+const cancelAllPageSize = 100
+
+// NewCancelAllOrdersTool creates a new tool for canceling all open orders
+func NewCancelAllOrdersTool() mcp.Tool {
+	return mcp.NewTool(
+		CancelAllOrdersToolID,
+		mcp.WithDescription("Cancel all open orders, optionally limited to a single trading pair"),
+		mcp.WithString(
+			"pair",
+			mcp.Description(ErrTradingPairDesc),
+		),
+	)
+}
+
+// HandleCancelAllOrders handles the cancel_all_orders tool
+func HandleCancelAllOrders(cfg *config.Config) server.ToolHandlerFunc {
+	return func(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
+		// Since we're using a private API endpoint, authentication errors will be handled by the API call
+
+		// An empty pair cancels open orders across all pairs.
+		pair := request.GetString("pair", "")
+		if pair != "" {
+			pair = normalizeCurrencyPair(pair)
+		}
+
+		// Each listing call is capped at one page, so keep listing and
+		// cancelling until no pending orders remain. Orders that were already
+		// attempted are skipped in case a cancellation has not yet been
+		// reflected in the listing, and a pass that cancels nothing ends the
+		// loop so stuck orders cannot spin it forever.
+		seen := make(map[string]bool)
+		var results []cancelResult
+		for {
+			orders, err := cfg.LunoClient.ListOrders(ctx, &luno.ListOrdersRequest{
+				Pair:  pair,
+				State: luno.OrderStatePending,
+				Limit: cancelAllPageSize,
+			})
+			if err != nil {
+				return mcp.NewToolResultError(fmt.Sprintf("Failed to list open orders: %v", err)), nil
+			}
+
+			var targets []cancelTarget
+			for _, order := range orders.Orders {
+				if seen[order.OrderId] {
+					continue
+				}
+				seen[order.OrderId] = true
+				targets = append(targets, cancelTarget{OrderID: order.OrderId, Pair: order.Pair})
+			}
+			if len(targets) == 0 {
+				break
+			}
+
+			// Dispatch the cancellations concurrently (bounded by
+			// maxConcurrentCancels) so N orders cost roughly one round-trip
+			// instead of N sequential ones.
+			pageResults := cancelOrdersConcurrently(ctx, cfg, targets)
+			results = append(results, pageResults...)
+
+			if len(orders.Orders) < cancelAllPageSize || countCancelled(pageResults) == 0 {
+				break
+			}
+		}
+
+		if len(results) == 0 {
+			return mcp.NewToolResultText("No open orders to cancel."), nil
+		}
+
+		resultJSON, err := jsonutil.MarshalIndent(results)
+		if err != nil {
+			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal results: %v", err)), nil
+		}
+
+		return mcp.NewToolResultText(fmt.Sprintf("Cancelled %d of %d open orders:\n\n%s",
+			countCancelled(results), len(results), string(resultJSON))), nil
+	}
+}
+
 // NewListOrdersTool creates a new tool for listing orders
 func NewListOrdersTool() mcp.Tool {
 	return mcp.NewTool(
@@ -375,7 +608,7 @@ func HandleListOrders(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to list orders: %v", err)), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(orders, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(orders)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal orders: %v", err)), nil
 		}
@@ -440,7 +673,7 @@ func HandleListTransactions(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to list transactions: %v", err)), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(transactions, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(transactions)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal transactions: %v", err)), nil
 		}
@@ -494,11 +727,12 @@ func HandleGetTransaction(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultError(fmt.Sprintf("Invalid transaction ID format: %v. Please provide a valid numeric transaction ID.", err)), nil
 		}
 
-		// Get the list of transactions with MinRow and MaxRow
+		// The transaction ID is the row index, so request exactly that row
+		// instead of scanning a large range for it
 		listReq := &luno.ListTransactionsRequest{
 			Id:     accountID,
-			MinRow: 0,    // Start from the beginning
-			MaxRow: 1000, // Use a reasonable max to find the transaction
+			MinRow: transactionID,
+			MaxRow: transactionID + 1,
 		}
 
 		transactions, err := cfg.LunoClient.ListTransactions(ctx, listReq)
@@ -519,7 +753,7 @@ func HandleGetTransaction(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultError(fmt.Sprintf("Transaction not found: %s", transactionIDStr)), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(transaction, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(transaction)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal transaction: %v", err)), nil
 		}
@@ -577,7 +811,7 @@ func HandleListTrades(cfg *config.Config) server.ToolHandlerFunc {
 			return mcp.NewToolResultErrorFromErr("listing trades", err), nil
 		}
 
-		resultJSON, err := json.MarshalIndent(trades, "", "  ")
+		resultJSON, err := jsonutil.MarshalIndent(trades)
 		if err != nil {
 			return mcp.NewToolResultError(fmt.Sprintf("Failed to marshal trades: %v", err)), nil
 		}
@@ -588,28 +822,79 @@ func HandleListTrades(cfg *config.Config) server.ToolHandlerFunc {
 
 // ===== Helper Functions =====
 
+// Replacers are built once at package load so each normalization is a single
+// pass over the input instead of rebuilding the mapping table per call.
+var (
+	// pairSeparatorReplacer strips the separators commonly used between currency codes
+	pairSeparatorReplacer = strings.NewReplacer("-", "", "_", "", "/", "")
+
+	// currencyCodeReplacer maps common symbols to Luno's expected format.
+	// Bitcoin is XBT on Luno. Longer aliases are listed first so they are
+	// matched before any shorter alias they contain. Only used as a fallback
+	// for input that does not parse as a known base/quote pair.
+	currencyCodeReplacer = strings.NewReplacer(
+		"BITCOIN", "XBT",
+		"BTC", "XBT",
+		// Add other mappings if needed in the future
+	)
+
+	// assetAliases maps common asset spellings to Luno's codes
+	assetAliases = map[string]string{
+		"BTC":     "XBT",
+		"BITCOIN": "XBT",
+	}
+
+	// knownAssets are the asset codes used to split a concatenated pair into
+	// its base and quote. Includes the 4-letter stablecoins so e.g. USDCZAR
+	// splits as USDC/ZAR rather than USD/CZAR.
+	knownAssets = map[string]bool{
+		// Cryptocurrencies
+		"XBT": true, "ETH": true, "XRP": true, "SOL": true, "LTC": true,
+		"BCH": true, "ADA": true, "DOT": true, "LINK": true, "AVAX": true,
+		"USDC": true, "USDT": true,
+		// Fiat currencies
+		"ZAR": true, "NGN": true, "MYR": true, "IDR": true, "UGX": true,
+		"ZMW": true, "USD": true, "EUR": true, "GBP": true, "AUD": true,
+	}
+)
+
+// canonicalAsset maps an asset code or alias to Luno's code, reporting
+// whether the code is recognised
+func canonicalAsset(code string) (string, bool) {
+	if alias, ok := assetAliases[code]; ok {
+		return alias, true
+	}
+	return code, knownAssets[code]
+}
+
+// splitPair splits a concatenated currency pair into its base and quote
+// assets. Every split point is tried so 4-letter assets parse correctly
+// instead of assuming a 3-character base.
+func splitPair(pair string) (base, quote string, ok bool) {
+	for i := 3; i <= len(pair)-3; i++ {
+		base, baseOK := canonicalAsset(pair[:i])
+		quote, quoteOK := canonicalAsset(pair[i:])
+		if baseOK && quoteOK {
+			return base, quote, true
+		}
+	}
+	return "", "", false
+}
+
 // normalizeCurrencyPair converts common currency pair formats to Luno's expected format
 func normalizeCurrencyPair(pair string) string {
 	// Log input for debugging
 	originalPair := pair
 
-	// Remove any separators that might be in the pair
-	pair = strings.Replace(pair, "-", "", -1)
-	pair = strings.Replace(pair, "_", "", -1)
-	pair = strings.Replace(pair, "/", "", -1)
-	pair = strings.ToUpper(pair)
-
-	// Apply currency code standardization
-	// Known mappings between common symbols and Luno's expected format
-	currencyMappings := map[string]string{
-		"BTC":     "XBT", // Bitcoin is XBT on Luno
-		"BITCOIN": "XBT",
-		// Add other mappings if needed in the future
-	}
-
-	// Apply all mappings
-	for common, luno := range currencyMappings {
-		pair = strings.Replace(pair, common, luno, -1)
+	// Remove any separators that might be in the pair, then standardize the
+	// currency codes. Parsing the pair into known assets keeps alias mapping
+	// per-asset; blind substring replacement remains only as a fallback for
+	// single assets and unrecognised codes.
+	pair = strings.ToUpper(pairSeparatorReplacer.Replace(pair))
+	if base, quote, ok := splitPair(pair); ok {
+		pair = base + quote
+	} else {
+		pair = currencyCodeReplacer.Replace(pair)
 	}
 
 	// Log the normalization for debugging
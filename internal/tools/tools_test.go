@@ -61,6 +61,8 @@ func TestNormalizeCurrencyPair(t *testing.T) {
 		{"BITCOIN in pair", "BITCOINUSD", "XBTUSD"},
 		{"Multiple separators", "BTC-_/GBP", "XBTGBP"},
 		{"Combo of mappings", "BITCOIN/GBP", "XBTGBP"},
+		{"Four-letter base asset", "USDCZAR", "USDCZAR"},
+		{"Four-letter quote asset", "solusdt", "SOLUSDT"},
 	}
 
 	for _, tc := range testCases {
@@ -74,6 +76,33 @@ func TestNormalizeCurrencyPair(t *testing.T) {
 	}
 }
 
+func TestSplitPair(t *testing.T) {
+	testCases := []struct {
+		name  string
+		input string
+		base  string
+		quote string
+		ok    bool
+	}{
+		{"Three-letter base and quote", "XBTZAR", "XBT", "ZAR", true},
+		{"Alias base", "BTCGBP", "XBT", "GBP", true},
+		{"Four-letter base", "USDCZAR", "USDC", "ZAR", true},
+		{"Four-letter quote", "SOLUSDC", "SOL", "USDC", true},
+		{"Single asset", "XBT", "", "", false},
+		{"Unknown assets", "FOOBAR", "", "", false},
+	}
+
+	for _, tc := range testCases {
+		t.Run(tc.name, func(t *testing.T) {
+			base, quote, ok := splitPair(tc.input)
+			if base != tc.base || quote != tc.quote || ok != tc.ok {
+				t.Errorf("splitPair(%q) = (%q, %q, %v), want (%q, %q, %v)",
+					tc.input, base, quote, ok, tc.base, tc.quote, tc.ok)
+			}
+		})
+	}
+}
+
 func TestToolCreation(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -93,6 +122,12 @@ func TestToolCreation(t *testing.T) {
 			toolName: GetTickerToolID,
 			params:   []string{"pair"},
 		},
+		{
+			name:     "GetTickers tool",
+			toolFunc: NewGetTickersTool,
+			toolName: GetTickersToolID,
+			params:   []string{"pairs"},
+		},
 		{
 			name:     "GetOrderBook tool",
 			toolFunc: NewGetOrderBookTool,
@@ -111,6 +146,12 @@ func TestToolCreation(t *testing.T) {
 			toolName: CancelOrderToolID,
 			params:   []string{"order_id"},
 		},
+		{
+			name:     "CancelAllOrders tool",
+			toolFunc: NewCancelAllOrdersTool,
+			toolName: CancelAllOrdersToolID,
+			params:   []string{"pair"},
+		},
 		{
 			name:     "ListOrders tool",
 			toolFunc: NewListOrdersTool,
@@ -190,6 +231,24 @@ func getTextContentFromResult(t *testing.T, result *mcp.CallToolResult) string {
 	return "" // Should not be reached
 }
 
+func TestEnhanceBalances(t *testing.T) {
+	balances := []luno.AccountBalance{
+		{AccountId: "789012", Asset: "ZAR", Balance: NewFromString(t, "10000.0"), Name: "ZAR Account"},
+		{AccountId: "123456", Asset: "XBT", Balance: NewFromString(t, "1.5"), Name: "XBT Account"},
+		{AccountId: "456789", Asset: "ZAR", Balance: NewFromString(t, "50.0"), Name: "Savings"},
+	}
+
+	enhanced := EnhanceBalances(balances)
+
+	assert.Len(t, enhanced, 3)
+	assert.Equal(t, "XBT", enhanced[0].Asset, "sorted by asset first")
+	assert.Equal(t, "456789", enhanced[1].AccountID, "ties broken by account ID")
+	assert.Equal(t, "789012", enhanced[2].AccountID)
+	assert.Equal(t, "1.5", enhanced[0].Balance, "decimals formatted as strings")
+
+	assert.Empty(t, EnhanceBalances(nil))
+}
+
 func TestHandleGetBalances(t *testing.T) {
 	tests := []struct {
 		name          string
@@ -382,6 +441,96 @@ func TestHandleGetTicker(t *testing.T) {
 	}
 }
 
+func TestHandleGetTickers(t *testing.T) {
+	tests := []struct {
+		name          string
+		requestParams map[string]any
+		mockSetup     func(*testing.T, *sdk.MockLunoClient)
+		expectedError bool
+		errorContains string
+	}{
+		{
+			name: "successful get tickers for specific pairs",
+			requestParams: map[string]any{
+				"pairs": "BTCZAR, ETHZAR",
+			},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockResponse := &luno.GetTickersResponse{
+					Tickers: []luno.Ticker{
+						{Pair: "XBTZAR", Bid: decimal.NewFromInt64(800000), Ask: decimal.NewFromInt64(800100)},
+						{Pair: "ETHZAR", Bid: decimal.NewFromInt64(50000), Ask: decimal.NewFromInt64(50100)},
+					},
+				}
+				mockClient.EXPECT().GetTickers(context.Background(), &luno.GetTickersRequest{
+					Pair: []string{"XBTZAR", "ETHZAR"},
+				}).Return(mockResponse, nil)
+			},
+			expectedError: false,
+		},
+		{
+			name:          "successful get tickers for all pairs",
+			requestParams: map[string]any{},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockResponse := &luno.GetTickersResponse{
+					Tickers: []luno.Ticker{
+						{Pair: "XBTZAR", Bid: decimal.NewFromInt64(800000), Ask: decimal.NewFromInt64(800100)},
+					},
+				}
+				mockClient.EXPECT().GetTickers(context.Background(), &luno.GetTickersRequest{}).
+					Return(mockResponse, nil)
+			},
+			expectedError: false,
+		},
+		{
+			name: "GetTickers API error",
+			requestParams: map[string]any{
+				"pairs": "INVALID",
+			},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockClient.EXPECT().GetTickers(context.Background(), &luno.GetTickersRequest{
+					Pair: []string{"INVALID"},
+				}).Return(nil, errors.New(invalidPairStr))
+			},
+			expectedError: true,
+			errorContains: "getting tickers",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mockClient := sdk.NewMockLunoClient(t)
+			tt.mockSetup(t, mockClient)
+
+			cfg := &config.Config{
+				LunoClient: mockClient,
+			}
+
+			handler := HandleGetTickers(cfg)
+			request := createMockRequest(tt.requestParams)
+
+			result, err := handler(context.Background(), request)
+
+			assert.NoError(t, err)
+			if tt.expectedError {
+				assert.True(t, result.IsError)
+				if tt.errorContains != "" {
+					errorText := getTextContentFromResult(t, result)
+					assert.Contains(t, errorText, tt.errorContains)
+				}
+			} else {
+				textContent := getTextContentFromResult(t, result)
+				assert.NotEmpty(t, textContent)
+
+				// Verify JSON structure
+				var tickersResponse map[string]any
+				err := json.Unmarshal([]byte(textContent), &tickersResponse)
+				assert.NoError(t, err)
+				assert.Contains(t, tickersResponse, "tickers")
+			}
+		})
+	}
+}
+
 func TestHandleGetOrderBook(t *testing.T) {
 	tests := []struct {
 		name          string
@@ -490,6 +639,39 @@ func TestHandleCancelOrder(t *testing.T) {
 			},
 			expectedError: false,
 		},
+		{
+			name: "single id with surrounding noise is trimmed",
+			requestParams: map[string]any{
+				"order_id": " 12345 ,",
+			},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "12345"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+			},
+			expectedError: false,
+		},
+		{
+			name: "only separators yields an error",
+			requestParams: map[string]any{
+				"order_id": ",",
+			},
+			mockSetup:     func(t *testing.T, mockClient *sdk.MockLunoClient) { /* No API call expected */ },
+			expectedError: true,
+			errorContains: "must contain at least one order ID",
+		},
+		{
+			name: "batch cancel with comma-separated ids",
+			requestParams: map[string]any{
+				"order_id": "111, 222",
+			},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "111"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "222"}).
+					Return(nil, errors.New("Order not found"))
+			},
+			expectedError: false,
+		},
 		{
 			name:          "missing order_id parameter",
 			requestParams: map[string]any{},
@@ -539,6 +721,135 @@ func TestHandleCancelOrder(t *testing.T) {
 	}
 }
 
+func TestHandleCancelAllOrders(t *testing.T) {
+	tests := []struct {
+		name          string
+		requestParams map[string]any
+		mockSetup     func(*testing.T, *sdk.MockLunoClient)
+		expectedError bool
+		contains      []string
+	}{
+		{
+			name: "cancels all open orders for a pair",
+			requestParams: map[string]any{
+				"pair": "XBTZAR",
+			},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockResponse := &luno.ListOrdersResponse{
+					Orders: []luno.Order{
+						{OrderId: "12345", Pair: "XBTZAR", State: luno.OrderStatePending},
+						{OrderId: "67890", Pair: "XBTZAR", State: luno.OrderStatePending},
+					},
+				}
+				mockClient.EXPECT().ListOrders(context.Background(), &luno.ListOrdersRequest{
+					Pair:  "XBTZAR",
+					State: luno.OrderStatePending,
+					Limit: 100,
+				}).Return(mockResponse, nil)
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "12345"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "67890"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+			},
+			contains: []string{"Cancelled 2 of 2", "12345", "67890"},
+		},
+		{
+			name:          "no open orders",
+			requestParams: map[string]any{},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockClient.EXPECT().ListOrders(context.Background(), &luno.ListOrdersRequest{
+					State: luno.OrderStatePending,
+					Limit: 100,
+				}).Return(&luno.ListOrdersResponse{}, nil)
+			},
+			contains: []string{"No open orders to cancel."},
+		},
+		{
+			name:          "paginates past a full page of open orders",
+			requestParams: map[string]any{},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				fullPage := &luno.ListOrdersResponse{}
+				for i := range 100 {
+					fullPage.Orders = append(fullPage.Orders, luno.Order{
+						OrderId: strconv.Itoa(i),
+						Pair:    "XBTZAR",
+						State:   luno.OrderStatePending,
+					})
+				}
+				lastPage := &luno.ListOrdersResponse{
+					Orders: []luno.Order{
+						{OrderId: "overflow", Pair: "XBTZAR", State: luno.OrderStatePending},
+					},
+				}
+				listReq := &luno.ListOrdersRequest{
+					State: luno.OrderStatePending,
+					Limit: 100,
+				}
+				mockClient.EXPECT().ListOrders(context.Background(), listReq).Return(fullPage, nil).Once()
+				mockClient.EXPECT().ListOrders(context.Background(), listReq).Return(lastPage, nil).Once()
+				mockClient.EXPECT().StopOrder(context.Background(), mock.Anything).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+			},
+			contains: []string{"Cancelled 101 of 101", "overflow"},
+		},
+		{
+			name:          "partial failure reports per-order errors",
+			requestParams: map[string]any{},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockResponse := &luno.ListOrdersResponse{
+					Orders: []luno.Order{
+						{OrderId: "12345", Pair: "XBTZAR", State: luno.OrderStatePending},
+						{OrderId: "67890", Pair: "ETHZAR", State: luno.OrderStatePending},
+					},
+				}
+				mockClient.EXPECT().ListOrders(context.Background(), &luno.ListOrdersRequest{
+					State: luno.OrderStatePending,
+					Limit: 100,
+				}).Return(mockResponse, nil)
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "12345"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil)
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "67890"}).
+					Return(nil, errors.New("Order not found"))
+			},
+			contains: []string{"Cancelled 1 of 2", "Order not found"},
+		},
+		{
+			name:          "ListOrders API error",
+			requestParams: map[string]any{},
+			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
+				mockClient.EXPECT().ListOrders(context.Background(), &luno.ListOrdersRequest{
+					State: luno.OrderStatePending,
+					Limit: 100,
+				}).Return(nil, errors.New(apiErrorStr))
+			},
+			expectedError: true,
+			contains:      []string{"Failed to list open orders"},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mockClient := sdk.NewMockLunoClient(t)
+			tt.mockSetup(t, mockClient)
+
+			cfg := &config.Config{
+				LunoClient: mockClient,
+			}
+
+			handler := HandleCancelAllOrders(cfg)
+			request := createMockRequest(tt.requestParams)
+
+			result, err := handler(context.Background(), request)
+			assert.NoError(t, err)
+			assert.Equal(t, tt.expectedError, result.IsError)
+			text := getTextContentFromResult(t, result)
+			for _, fragment := range tt.contains {
+				assert.Contains(t, text, fragment)
+			}
+		})
+	}
+}
+
 func TestHandleListOrders(t *testing.T) {
 	tests := []struct {
 		name          string
@@ -783,23 +1094,13 @@ func TestHandleGetTransaction(t *testing.T) {
 							Currency:       "XBT",
 							Description:    "Target transaction",
 						},
-						{
-							RowIndex:       6,
-							Timestamp:      luno.Time(time.UnixMilli(testTimestamp + 100000)),
-							Balance:        decimal.NewFromFloat64(1.6, -1),
-							Available:      decimal.NewFromFloat64(1.5, -1),
-							AvailableDelta: decimal.NewFromFloat64(0.1, -1),
-							BalanceDelta:   decimal.NewFromFloat64(0.1, -1),
-							Currency:       "XBT",
-							Description:    "Another transaction",
-						},
 					},
 				}
 				accountIdInt, _ := strconv.ParseInt("123456", 10, 64)
 				mockClient.EXPECT().ListTransactions(context.Background(), &luno.ListTransactionsRequest{
 					Id:     accountIdInt,
-					MinRow: 0,    // Default min_row for GetTransaction
-					MaxRow: 1000, // Default max_row for GetTransaction
+					MinRow: 5, // The transaction ID is the row index
+					MaxRow: 6,
 				}).Return(mockResponse, nil)
 			},
 			expectedError: false,
@@ -818,7 +1119,7 @@ func TestHandleGetTransaction(t *testing.T) {
 				accountIdInt, _ := strconv.ParseInt("123456", 10, 64)
 				mockClient.EXPECT().ListTransactions(context.Background(), &luno.ListTransactionsRequest{
 					Id:     accountIdInt,
-					MinRow: 0,
+					MinRow: 999,
 					MaxRow: 1000,
 				}).Return(mockResponse, nil)
 			},
@@ -1157,6 +1458,9 @@ func TestHandleCreateOrder(t *testing.T) {
 			},
 			mockSetup: func(t *testing.T, mockClient *sdk.MockLunoClient) {
 				mockClient.EXPECT().GetTicker(mock.Anything, mock.Anything).Return(nil, errors.New("API error"))
+				// GetMarketInfo fetches the order book concurrently with the ticker,
+				// so it is still called even though the ticker fails.
+				mockClient.EXPECT().GetOrderBook(mock.Anything, mock.Anything).Return(&luno.GetOrderBookResponse{}, nil)
 			},
 			expectedError: true,
 			errorContains: "Unable to create order: Failed to retrieve market information for pair XBTZAR",
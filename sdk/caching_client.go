@@ -0,0 +1,155 @@
+package sdk
+
+import (
+	"context"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/luno/luno-go"
+)
+
+// Default cache TTLs per endpoint. Balances only move when an order or
+// transfer executes, so they tolerate a longer window; market data goes
+// stale quickly.
+const (
+	defaultBalancesTTL  = 30 * time.Second
+	defaultTickerTTL    = 2 * time.Second
+	defaultOrderBookTTL = time.Second
+)
+
+// CacheTTLs configures how long each cached endpoint's responses stay fresh.
+// A zero or negative duration disables caching for that endpoint.
+type CacheTTLs struct {
+	Balances  time.Duration
+	Ticker    time.Duration
+	OrderBook time.Duration
+}
+
+// DefaultCacheTTLs returns the cache windows used when none are configured
+func DefaultCacheTTLs() CacheTTLs {
+	return CacheTTLs{
+		Balances:  defaultBalancesTTL,
+		Ticker:    defaultTickerTTL,
+		OrderBook: defaultOrderBookTTL,
+	}
+}
+
+// compile-time check that *CachingClient implements our interface
+var _ LunoClient = (*CachingClient)(nil)
+
+// cacheEpoch anchors entry expiry to the monotonic clock: expiry times are
+// stored as integer offsets from this instant and compared with
+// time.Since, so they are immune to wall-clock jumps (NTP slews, manual
+// changes) that could otherwise keep stale entries alive or evict fresh ones.
+var cacheEpoch = time.Now()
+
+type cacheEntry struct {
+	expiresAt time.Duration // offset from cacheEpoch
+	value     any
+}
+
+// CachingClient wraps a LunoClient with a short-TTL in-memory cache for the
+// read-only endpoints that MCP clients tend to hit repeatedly (balances,
+// ticker and order book). Repeated reads within the TTL window are served
+// from memory instead of paying an API round-trip. Successful order
+// mutations invalidate the cached balances so they are re-fetched.
+type CachingClient struct {
+	LunoClient
+
+	ttls CacheTTLs
+
+	mu      sync.Mutex
+	entries map[string]cacheEntry
+}
+
+// NewCachingClient creates a caching decorator around the given client using
+// the default TTLs
+func NewCachingClient(client LunoClient) *CachingClient {
+	return NewCachingClientWithTTLs(client, DefaultCacheTTLs())
+}
+
+// NewCachingClientWithTTLs creates a caching decorator with explicit TTLs
+func NewCachingClientWithTTLs(client LunoClient, ttls CacheTTLs) *CachingClient {
+	return &CachingClient{
+		LunoClient: client,
+		ttls:       ttls,
+		entries:    make(map[string]cacheEntry),
+	}
+}
+
+// GetBalances returns cached balances when fresh, fetching otherwise
+func (c *CachingClient) GetBalances(ctx context.Context, req *luno.GetBalancesRequest) (*luno.GetBalancesResponse, error) {
+	key := "balances:" + strings.Join(req.Assets, ",")
+	return cached(c, key, c.ttls.Balances, func() (*luno.GetBalancesResponse, error) {
+		return c.LunoClient.GetBalances(ctx, req)
+	})
+}
+
+// GetTicker returns a cached ticker for the pair when fresh, fetching otherwise
+func (c *CachingClient) GetTicker(ctx context.Context, req *luno.GetTickerRequest) (*luno.GetTickerResponse, error) {
+	return cached(c, "ticker:"+req.Pair, c.ttls.Ticker, func() (*luno.GetTickerResponse, error) {
+		return c.LunoClient.GetTicker(ctx, req)
+	})
+}
+
+// GetOrderBook returns a cached order book for the pair when fresh, fetching otherwise
+func (c *CachingClient) GetOrderBook(ctx context.Context, req *luno.GetOrderBookRequest) (*luno.GetOrderBookResponse, error) {
+	return cached(c, "orderbook:"+req.Pair, c.ttls.OrderBook, func() (*luno.GetOrderBookResponse, error) {
+		return c.LunoClient.GetOrderBook(ctx, req)
+	})
+}
+
+// PostLimitOrder forwards the order and invalidates cached balances on success
+func (c *CachingClient) PostLimitOrder(ctx context.Context, req *luno.PostLimitOrderRequest) (*luno.PostLimitOrderResponse, error) {
+	res, err := c.LunoClient.PostLimitOrder(ctx, req)
+	if err == nil {
+		c.invalidatePrefix("balances:")
+	}
+	return res, err
+}
+
+// StopOrder forwards the cancellation and invalidates cached balances on success
+func (c *CachingClient) StopOrder(ctx context.Context, req *luno.StopOrderRequest) (*luno.StopOrderResponse, error) {
+	res, err := c.LunoClient.StopOrder(ctx, req)
+	if err == nil {
+		c.invalidatePrefix("balances:")
+	}
+	return res, err
+}
+
+// cached returns the fresh cache entry for key, or fetches and stores one.
+// Errors are never cached, and a non-positive TTL bypasses the cache entirely.
+func cached[T any](c *CachingClient, key string, ttl time.Duration, fetch func() (*T, error)) (*T, error) {
+	if ttl <= 0 {
+		return fetch()
+	}
+
+	c.mu.Lock()
+	entry, ok := c.entries[key]
+	c.mu.Unlock()
+	if ok && time.Since(cacheEpoch) < entry.expiresAt {
+		return entry.value.(*T), nil
+	}
+
+	value, err := fetch()
+	if err != nil {
+		return nil, err
+	}
+
+	c.mu.Lock()
+	c.entries[key] = cacheEntry{expiresAt: time.Since(cacheEpoch) + ttl, value: value}
+	c.mu.Unlock()
+	return value, nil
+}
+
+// invalidatePrefix drops all cache entries whose key starts with prefix
+func (c *CachingClient) invalidatePrefix(prefix string) {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	for key := range c.entries {
+		if strings.HasPrefix(key, prefix) {
+			delete(c.entries, key)
+		}
+	}
+}
@@ -0,0 +1,130 @@
+package sdk
+
+import (
+	"context"
+	"errors"
+	"testing"
+
+	"github.com/luno/luno-go"
+	"github.com/luno/luno-go/decimal"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestCachingClientGetBalances(t *testing.T) {
+	mockClient := NewMockLunoClient(t)
+	mockResponse := &luno.GetBalancesResponse{
+		Balance: []luno.AccountBalance{
+			{AccountId: "123456", Asset: "XBT", Balance: decimal.NewFromInt64(1)},
+		},
+	}
+	mockClient.EXPECT().GetBalances(context.Background(), &luno.GetBalancesRequest{}).
+		Return(mockResponse, nil).Once()
+
+	client := NewCachingClient(mockClient)
+
+	first, err := client.GetBalances(context.Background(), &luno.GetBalancesRequest{})
+	assert.NoError(t, err)
+	assert.Equal(t, mockResponse, first)
+
+	// Second call within the TTL is served from the cache, not the API.
+	second, err := client.GetBalances(context.Background(), &luno.GetBalancesRequest{})
+	assert.NoError(t, err)
+	assert.Equal(t, mockResponse, second)
+}
+
+func TestCachingClientGetTickerCachesPerPair(t *testing.T) {
+	mockClient := NewMockLunoClient(t)
+	xbtResponse := &luno.GetTickerResponse{Pair: "XBTZAR"}
+	ethResponse := &luno.GetTickerResponse{Pair: "ETHZAR"}
+	mockClient.EXPECT().GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "XBTZAR"}).
+		Return(xbtResponse, nil).Once()
+	mockClient.EXPECT().GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "ETHZAR"}).
+		Return(ethResponse, nil).Once()
+
+	client := NewCachingClient(mockClient)
+
+	for range 2 {
+		ticker, err := client.GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "XBTZAR"})
+		assert.NoError(t, err)
+		assert.Equal(t, xbtResponse, ticker)
+
+		ticker, err = client.GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "ETHZAR"})
+		assert.NoError(t, err)
+		assert.Equal(t, ethResponse, ticker)
+	}
+}
+
+func TestCachingClientDisabledTTLBypassesCache(t *testing.T) {
+	mockClient := NewMockLunoClient(t)
+	mockClient.EXPECT().GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "XBTZAR"}).
+		Return(&luno.GetTickerResponse{Pair: "XBTZAR"}, nil).Twice()
+
+	ttls := DefaultCacheTTLs()
+	ttls.Ticker = 0
+	client := NewCachingClientWithTTLs(mockClient, ttls)
+
+	for range 2 {
+		ticker, err := client.GetTicker(context.Background(), &luno.GetTickerRequest{Pair: "XBTZAR"})
+		assert.NoError(t, err)
+		assert.Equal(t, "XBTZAR", ticker.Pair)
+	}
+}
+
+func TestCachingClientDoesNotCacheErrors(t *testing.T) {
+	mockClient := NewMockLunoClient(t)
+	mockClient.EXPECT().GetOrderBook(context.Background(), &luno.GetOrderBookRequest{Pair: "XBTZAR"}).
+		Return(nil, errors.New("API error")).Twice()
+
+	client := NewCachingClient(mockClient)
+
+	for range 2 {
+		orderBook, err := client.GetOrderBook(context.Background(), &luno.GetOrderBookRequest{Pair: "XBTZAR"})
+		assert.Error(t, err)
+		assert.Nil(t, orderBook)
+	}
+}
+
+func TestCachingClientInvalidatesBalancesOnOrderMutation(t *testing.T) {
+	tests := []struct {
+		name   string
+		mutate func(t *testing.T, client *CachingClient, mockClient *MockLunoClient)
+	}{
+		{
+			name: "PostLimitOrder invalidates balances",
+			mutate: func(t *testing.T, client *CachingClient, mockClient *MockLunoClient) {
+				mockClient.EXPECT().PostLimitOrder(context.Background(), &luno.PostLimitOrderRequest{Pair: "XBTZAR"}).
+					Return(&luno.PostLimitOrderResponse{OrderId: "12345"}, nil).Once()
+				_, err := client.PostLimitOrder(context.Background(), &luno.PostLimitOrderRequest{Pair: "XBTZAR"})
+				assert.NoError(t, err)
+			},
+		},
+		{
+			name: "StopOrder invalidates balances",
+			mutate: func(t *testing.T, client *CachingClient, mockClient *MockLunoClient) {
+				mockClient.EXPECT().StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "12345"}).
+					Return(&luno.StopOrderResponse{Success: true}, nil).Once()
+				_, err := client.StopOrder(context.Background(), &luno.StopOrderRequest{OrderId: "12345"})
+				assert.NoError(t, err)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			mockClient := NewMockLunoClient(t)
+			mockClient.EXPECT().GetBalances(context.Background(), &luno.GetBalancesRequest{}).
+				Return(&luno.GetBalancesResponse{}, nil).Twice()
+
+			client := NewCachingClient(mockClient)
+
+			_, err := client.GetBalances(context.Background(), &luno.GetBalancesRequest{})
+			assert.NoError(t, err)
+
+			tt.mutate(t, client, mockClient)
+
+			// The mutation dropped the cached balances, so this hits the API again.
+			_, err = client.GetBalances(context.Background(), &luno.GetBalancesRequest{})
+			assert.NoError(t, err)
+		})
+	}
+}
@@ -0,0 +1,80 @@
+package sdk
+
+import (
+	"log/slog"
+	"net/http"
+	"sync/atomic"
+	"time"
+)
+
+const (
+	// emaDivisor gives each new sample a 1/5 weight in the moving average
+	emaDivisor = 5
+
+	// defaultLatencyWarnThreshold is the request duration above which a
+	// warning is logged
+	defaultLatencyWarnThreshold = time.Second
+)
+
+// compile-time check that *LatencyTransport implements http.RoundTripper
+var _ http.RoundTripper = (*LatencyTransport)(nil)
+
+// LatencyTransport is an http.RoundTripper that measures the duration of
+// every Luno API request and keeps an exponential moving average. Requests
+// slower than the warning threshold are logged, so degraded API latency is
+// visible instead of silently producing stale market data. The average is
+// available via EMA for callers that want to gate on it.
+type LatencyTransport struct {
+	base          http.RoundTripper
+	warnThreshold time.Duration
+	emaNanos      atomic.Int64
+}
+
+// NewLatencyTransport wraps base with latency tracking. A nil base uses
+// http.DefaultTransport.
+func NewLatencyTransport(base http.RoundTripper) *LatencyTransport {
+	if base == nil {
+		base = http.DefaultTransport
+	}
+	return &LatencyTransport{
+		base:          base,
+		warnThreshold: defaultLatencyWarnThreshold,
+	}
+}
+
+// RoundTrip implements http.RoundTripper
+func (t *LatencyTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	start := time.Now()
+	res, err := t.base.RoundTrip(req)
+	t.observe(req, time.Since(start))
+	return res, err
+}
+
+// EMA returns the exponential moving average of observed request durations,
+// or zero before any request has completed
+func (t *LatencyTransport) EMA() time.Duration {
+	return time.Duration(t.emaNanos.Load())
+}
+
+// observe folds a sample into the moving average and warns on slow requests
+func (t *LatencyTransport) observe(req *http.Request, elapsed time.Duration) {
+	for {
+		previous := t.emaNanos.Load()
+		updated := int64(elapsed)
+		if previous != 0 {
+			updated = previous + (int64(elapsed)-previous)/emaDivisor
+		}
+		if t.emaNanos.CompareAndSwap(previous, updated) {
+			break
+		}
+	}
+
+	if elapsed > t.warnThreshold {
+		slog.Warn("Slow Luno API request",
+			"method", req.Method,
+			"path", req.URL.Path,
+			"duration", elapsed,
+			"average", t.EMA(),
+		)
+	}
+}
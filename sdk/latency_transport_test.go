@@ -0,0 +1,34 @@
+package sdk
+
+import (
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLatencyTransportTracksEMA(t *testing.T) {
+	transport := NewLatencyTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		return newTestResponse(http.StatusOK), nil
+	}))
+
+	assert.Equal(t, time.Duration(0), transport.EMA(), "no samples yet")
+
+	res, err := transport.RoundTrip(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil))
+	require.NoError(t, err)
+	assert.Equal(t, http.StatusOK, res.StatusCode)
+	assert.Greater(t, transport.EMA(), time.Duration(0), "EMA should reflect the first sample")
+}
+
+func TestLatencyTransportEMAConverges(t *testing.T) {
+	transport := NewLatencyTransport(nil)
+
+	transport.observe(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil), 100*time.Millisecond)
+	assert.Equal(t, 100*time.Millisecond, transport.EMA(), "first sample seeds the average")
+
+	transport.observe(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil), 200*time.Millisecond)
+	assert.Equal(t, 120*time.Millisecond, transport.EMA(), "new samples carry a 1/5 weight")
+}
@@ -0,0 +1,49 @@
+package sdk
+
+import (
+	"net/http"
+)
+
+// DefaultMaxConcurrentRequests caps how many Luno API requests may be in
+// flight at once, keeping concurrent tool calls under the exchange's rate
+// limits instead of bursting into 429 responses.
+const DefaultMaxConcurrentRequests = 8
+
+// compile-time check that *LimitTransport implements http.RoundTripper
+var _ http.RoundTripper = (*LimitTransport)(nil)
+
+// LimitTransport is an http.RoundTripper that bounds the number of
+// concurrent requests with a semaphore. Requests beyond the cap queue until
+// a slot frees, or fail with the request context's error if it is cancelled
+// while waiting.
+type LimitTransport struct {
+	base http.RoundTripper
+	sem  chan struct{}
+}
+
+// NewLimitTransport wraps base with a concurrency cap. A nil base uses
+// http.DefaultTransport and a non-positive limit uses the default.
+func NewLimitTransport(base http.RoundTripper, limit int) *LimitTransport {
+	if base == nil {
+		base = http.DefaultTransport
+	}
+	if limit <= 0 {
+		limit = DefaultMaxConcurrentRequests
+	}
+	return &LimitTransport{
+		base: base,
+		sem:  make(chan struct{}, limit),
+	}
+}
+
+// RoundTrip implements http.RoundTripper
+func (t *LimitTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	select {
+	case t.sem <- struct{}{}:
+	case <-req.Context().Done():
+		return nil, req.Context().Err()
+	}
+	defer func() { <-t.sem }()
+
+	return t.base.RoundTrip(req)
+}
@@ -0,0 +1,74 @@
+package sdk
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestLimitTransportCapsConcurrency(t *testing.T) {
+	const limit = 2
+	const requests = 8
+
+	var inFlight, peak atomic.Int64
+	transport := NewLimitTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		current := inFlight.Add(1)
+		for {
+			observed := peak.Load()
+			if current <= observed || peak.CompareAndSwap(observed, current) {
+				break
+			}
+		}
+		time.Sleep(5 * time.Millisecond)
+		inFlight.Add(-1)
+		return newTestResponse(http.StatusOK), nil
+	}), limit)
+
+	var wg sync.WaitGroup
+	for range requests {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			res, err := transport.RoundTrip(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil))
+			assert.NoError(t, err)
+			assert.Equal(t, http.StatusOK, res.StatusCode)
+		}()
+	}
+	wg.Wait()
+
+	assert.LessOrEqual(t, peak.Load(), int64(limit), "in-flight requests must not exceed the cap")
+}
+
+func TestLimitTransportHonoursContextWhileQueued(t *testing.T) {
+	release := make(chan struct{})
+	transport := NewLimitTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		<-release
+		return newTestResponse(http.StatusOK), nil
+	}), 1)
+	defer close(release)
+
+	// Occupy the only slot
+	go transport.RoundTrip(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil))
+
+	// Give the first request time to claim the slot before queueing another
+	time.Sleep(10 * time.Millisecond)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+	req := httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil).WithContext(ctx)
+
+	_, err := transport.RoundTrip(req)
+	require.ErrorIs(t, err, context.Canceled)
+}
+
+func TestNewLimitTransportDefaultsNonPositiveLimit(t *testing.T) {
+	transport := NewLimitTransport(nil, 0)
+	assert.Equal(t, DefaultMaxConcurrentRequests, cap(transport.sem))
+}
@@ -243,6 +243,74 @@ func (_c *MockLunoClient_GetTicker_Call) RunAndReturn(run func(ctx context.Conte
 	return _c
 }
 
+// GetTickers provides a mock function for the type MockLunoClient
+func (_mock *MockLunoClient) GetTickers(ctx context.Context, req *luno.GetTickersRequest) (*luno.GetTickersResponse, error) {
+	ret := _mock.Called(ctx, req)
+
+	if len(ret) == 0 {
+		panic("no return value specified for GetTickers")
+	}
+
+	var r0 *luno.GetTickersResponse
+	var r1 error
+	if returnFunc, ok := ret.Get(0).(func(context.Context, *luno.GetTickersRequest) (*luno.GetTickersResponse, error)); ok {
+		return returnFunc(ctx, req)
+	}
+	if returnFunc, ok := ret.Get(0).(func(context.Context, *luno.GetTickersRequest) *luno.GetTickersResponse); ok {
+		r0 = returnFunc(ctx, req)
+	} else {
+		if ret.Get(0) != nil {
+			r0 = ret.Get(0).(*luno.GetTickersResponse)
+		}
+	}
+	if returnFunc, ok := ret.Get(1).(func(context.Context, *luno.GetTickersRequest) error); ok {
+		r1 = returnFunc(ctx, req)
+	} else {
+		r1 = ret.Error(1)
+	}
+	return r0, r1
+}
+
+// MockLunoClient_GetTickers_Call is a *mock.Call that shadows Run/Return methods with type explicit version for method 'GetTickers'
+type MockLunoClient_GetTickers_Call struct {
+	*mock.Call
+}
+
+// GetTickers is a helper method to define mock.On call
+//   - ctx context.Context
+//   - req *luno.GetTickersRequest
+func (_e *MockLunoClient_Expecter) GetTickers(ctx interface{}, req interface{}) *MockLunoClient_GetTickers_Call {
+	return &MockLunoClient_GetTickers_Call{Call: _e.mock.On("GetTickers", ctx, req)}
+}
+
+func (_c *MockLunoClient_GetTickers_Call) Run(run func(ctx context.Context, req *luno.GetTickersRequest)) *MockLunoClient_GetTickers_Call {
+	_c.Call.Run(func(args mock.Arguments) {
+		var arg0 context.Context
+		if args[0] != nil {
+			arg0 = args[0].(context.Context)
+		}
+		var arg1 *luno.GetTickersRequest
+		if args[1] != nil {
+			arg1 = args[1].(*luno.GetTickersRequest)
+		}
+		run(
+			arg0,
+			arg1,
+		)
+	})
+	return _c
+}
+
+func (_c *MockLunoClient_GetTickers_Call) Return(getTickersResponse *luno.GetTickersResponse, err error) *MockLunoClient_GetTickers_Call {
+	_c.Call.Return(getTickersResponse, err)
+	return _c
+}
+
+func (_c *MockLunoClient_GetTickers_Call) RunAndReturn(run func(ctx context.Context, req *luno.GetTickersRequest) (*luno.GetTickersResponse, error)) *MockLunoClient_GetTickers_Call {
+	_c.Call.Return(run)
+	return _c
+}
+
 // ListOrders provides a mock function for the type MockLunoClient
 func (_mock *MockLunoClient) ListOrders(ctx context.Context, req *luno.ListOrdersRequest) (*luno.ListOrdersResponse, error) {
 	ret := _mock.Called(ctx, req)
@@ -0,0 +1,170 @@
+package sdk
+
+import (
+	"errors"
+	"io"
+	"net/http"
+	"strconv"
+	"sync"
+	"time"
+)
+
+// Retry and circuit breaker tuning. Transient 429/5xx responses are retried
+// with exponential backoff; repeated exhausted retries open the breaker so a
+// degraded API is not hammered while it recovers.
+const (
+	defaultMaxRetries = 3
+	defaultRetryDelay = 250 * time.Millisecond
+	defaultMaxDelay   = 4 * time.Second
+
+	breakerThreshold = 3
+	breakerCooldown  = 30 * time.Second
+)
+
+// ErrCircuitOpen is returned while the breaker is open after repeated failures
+var ErrCircuitOpen = errors.New("luno API circuit breaker open: too many consecutive failures")
+
+// retryStatusCodes are the transient response codes worth retrying
+var retryStatusCodes = map[int]bool{
+	http.StatusTooManyRequests:    true,
+	http.StatusBadGateway:         true,
+	http.StatusServiceUnavailable: true,
+	http.StatusGatewayTimeout:     true,
+}
+
+// compile-time check that *RetryTransport implements http.RoundTripper
+var _ http.RoundTripper = (*RetryTransport)(nil)
+
+// RetryTransport is an http.RoundTripper that retries transient failures of
+// GET requests with exponential backoff, honouring any Retry-After header.
+// Only GETs are retried: order mutations are not safe to replay when the
+// original request may have been applied. When several requests in a row
+// exhaust their retries the transport opens a circuit breaker and fails fast
+// for a cooldown period instead of adding load to a struggling API.
+type RetryTransport struct {
+	base       http.RoundTripper
+	maxRetries int
+	baseDelay  time.Duration
+	maxDelay   time.Duration
+
+	mu                  sync.Mutex
+	consecutiveFailures int
+	openUntil           time.Time
+}
+
+// NewRetryTransport wraps base with the default retry and breaker settings.
+// A nil base uses http.DefaultTransport.
+func NewRetryTransport(base http.RoundTripper) *RetryTransport {
+	if base == nil {
+		base = http.DefaultTransport
+	}
+	return &RetryTransport{
+		base:       base,
+		maxRetries: defaultMaxRetries,
+		baseDelay:  defaultRetryDelay,
+		maxDelay:   defaultMaxDelay,
+	}
+}
+
+// RoundTrip implements http.RoundTripper
+func (t *RetryTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	if req.Method != http.MethodGet {
+		return t.base.RoundTrip(req)
+	}
+	if t.circuitOpen() {
+		return nil, ErrCircuitOpen
+	}
+
+	var (
+		res *http.Response
+		err error
+	)
+	for attempt := 0; ; attempt++ {
+		res, err = t.base.RoundTrip(req)
+		if !shouldRetry(res, err) {
+			t.recordSuccess()
+			return res, err
+		}
+		if attempt >= t.maxRetries {
+			break
+		}
+
+		delay := t.backoff(attempt)
+		if res != nil {
+			if after := retryAfter(res); after > delay {
+				delay = after
+			}
+			// Drain so the underlying connection can be reused for the retry
+			io.Copy(io.Discard, res.Body)
+			res.Body.Close()
+		}
+
+		select {
+		case <-req.Context().Done():
+			return nil, req.Context().Err()
+		case <-time.After(delay):
+		}
+	}
+
+	t.recordFailure()
+	return res, err
+}
+
+// backoff returns the exponential delay for the given zero-based attempt
+func (t *RetryTransport) backoff(attempt int) time.Duration {
+	delay := t.baseDelay << attempt
+	if delay > t.maxDelay {
+		delay = t.maxDelay
+	}
+	return delay
+}
+
+// shouldRetry reports whether the response or error is a transient failure.
+// Network errors are treated as transient since only GETs reach this path.
+func shouldRetry(res *http.Response, err error) bool {
+	if err != nil {
+		return true
+	}
+	return retryStatusCodes[res.StatusCode]
+}
+
+// retryAfter returns the delay requested by the Retry-After header, if any
+func retryAfter(res *http.Response) time.Duration {
+	header := res.Header.Get("Retry-After")
+	if header == "" {
+		return 0
+	}
+	if seconds, err := strconv.Atoi(header); err == nil && seconds > 0 {
+		return time.Duration(seconds) * time.Second
+	}
+	if at, err := http.ParseTime(header); err == nil {
+		return time.Until(at)
+	}
+	return 0
+}
+
+// circuitOpen reports whether the breaker is currently rejecting requests
+func (t *RetryTransport) circuitOpen() bool {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	return time.Now().Before(t.openUntil)
+}
+
+// recordSuccess resets the breaker after any request that did not exhaust retries
+func (t *RetryTransport) recordSuccess() {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	t.consecutiveFailures = 0
+}
+
+// recordFailure counts an exhausted retry sequence, opening the breaker once
+// the threshold is reached
+func (t *RetryTransport) recordFailure() {
+	t.mu.Lock()
+	defer t.mu.Unlock()
+	t.consecutiveFailures++
+	if t.consecutiveFailures >= breakerThreshold {
+		t.openUntil = time.Now().Add(breakerCooldown)
+		t.consecutiveFailures = 0
+	}
+}
@@ -0,0 +1,107 @@
+package sdk
+
+import (
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// roundTripperFunc adapts a function to http.RoundTripper for tests
+type roundTripperFunc func(*http.Request) (*http.Response, error)
+
+func (f roundTripperFunc) RoundTrip(req *http.Request) (*http.Response, error) {
+	return f(req)
+}
+
+func newTestResponse(status int) *http.Response {
+	return &http.Response{
+		StatusCode: status,
+		Header:     http.Header{},
+		Body:       io.NopCloser(strings.NewReader("")),
+	}
+}
+
+func newFastRetryTransport(base http.RoundTripper) *RetryTransport {
+	transport := NewRetryTransport(base)
+	transport.baseDelay = time.Millisecond
+	transport.maxDelay = 2 * time.Millisecond
+	return transport
+}
+
+func TestRetryTransportRetriesTransientStatus(t *testing.T) {
+	calls := 0
+	transport := newFastRetryTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		calls++
+		if calls < 3 {
+			return newTestResponse(http.StatusServiceUnavailable), nil
+		}
+		return newTestResponse(http.StatusOK), nil
+	}))
+
+	res, err := transport.RoundTrip(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil))
+	require.NoError(t, err)
+	assert.Equal(t, http.StatusOK, res.StatusCode)
+	assert.Equal(t, 3, calls)
+}
+
+func TestRetryTransportDoesNotRetryPost(t *testing.T) {
+	calls := 0
+	transport := newFastRetryTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		calls++
+		return newTestResponse(http.StatusServiceUnavailable), nil
+	}))
+
+	res, err := transport.RoundTrip(httptest.NewRequest(http.MethodPost, "https://api.luno.com/api/1/postorder", nil))
+	require.NoError(t, err)
+	assert.Equal(t, http.StatusServiceUnavailable, res.StatusCode)
+	assert.Equal(t, 1, calls, "mutating requests must not be replayed")
+}
+
+func TestRetryTransportDoesNotRetryClientError(t *testing.T) {
+	calls := 0
+	transport := newFastRetryTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		calls++
+		return newTestResponse(http.StatusBadRequest), nil
+	}))
+
+	res, err := transport.RoundTrip(httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil))
+	require.NoError(t, err)
+	assert.Equal(t, http.StatusBadRequest, res.StatusCode)
+	assert.Equal(t, 1, calls)
+}
+
+func TestRetryTransportOpensCircuitAfterRepeatedFailures(t *testing.T) {
+	calls := 0
+	transport := newFastRetryTransport(roundTripperFunc(func(req *http.Request) (*http.Response, error) {
+		calls++
+		return newTestResponse(http.StatusServiceUnavailable), nil
+	}))
+	transport.maxRetries = 0
+
+	req := httptest.NewRequest(http.MethodGet, "https://api.luno.com/api/1/ticker", nil)
+	for range breakerThreshold {
+		res, err := transport.RoundTrip(req)
+		require.NoError(t, err)
+		assert.Equal(t, http.StatusServiceUnavailable, res.StatusCode)
+	}
+
+	callsBefore := calls
+	_, err := transport.RoundTrip(req)
+	assert.ErrorIs(t, err, ErrCircuitOpen)
+	assert.Equal(t, callsBefore, calls, "open breaker should fail fast without a request")
+}
+
+func TestRetryAfterHeader(t *testing.T) {
+	res := newTestResponse(http.StatusTooManyRequests)
+	res.Header.Set("Retry-After", "2")
+	assert.Equal(t, 2*time.Second, retryAfter(res))
+
+	res.Header.Del("Retry-After")
+	assert.Equal(t, time.Duration(0), retryAfter(res))
+}